@@ -8,6 +8,7 @@ from typing import Generator
 from sqlalchemy import inspect, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from . import config as config_module
@@ -15,6 +16,9 @@ from .config import PROJECT_ROOT
 from .migrations import run_migrations
 
 _engine = None
+# Engine that ``init_db`` last brought fully up to date; repeat calls against
+# the same engine (test setup followed by app startup) skip the DDL checks.
+_initialised_engine = None
 
 
 def get_engine():
@@ -26,10 +30,16 @@ def get_engine():
         database_url = settings.database_url
         url = make_url(database_url)
         connect_args = {"check_same_thread": False} if url.get_backend_name() == "sqlite" else {}
+        engine_kwargs: dict = {}
 
         if url.get_backend_name() == "sqlite":
             database = url.database
-            if database and database != ":memory:":
+            if not database or database == ":memory:":
+                # A private in-memory database lives on a single connection, so
+                # every session (including the TestClient worker thread) must
+                # share it.
+                engine_kwargs["poolclass"] = StaticPool
+            else:
                 db_path = Path(database)
                 if not db_path.is_absolute():
                     db_path = (PROJECT_ROOT / db_path).resolve()
@@ -37,7 +47,7 @@ def get_engine():
                 url = url.set(database=str(db_path))
                 database_url = url.render_as_string(hide_password=False)
 
-        _engine = create_engine(database_url, connect_args=connect_args)
+        _engine = create_engine(database_url, connect_args=connect_args, **engine_kwargs)
     return _engine
 
 
@@ -52,6 +62,8 @@ def get_session() -> Generator[Session, None, None]:
 def init_db() -> None:
     """Initialise database tables."""
 
+    global _initialised_engine
+
     from .models import (  # noqa: F401  Ensures models are registered with SQLModel metadata.
         artifacts,
         document,
@@ -62,6 +74,8 @@ def init_db() -> None:
     )
 
     engine = get_engine()
+    if engine is _initialised_engine:
+        return
     SQLModel.metadata.create_all(engine)
     run_migrations(engine)
 
@@ -102,9 +116,12 @@ def init_db() -> None:
                 text("ALTER TABLE document ADD COLUMN last_parsed_at DATETIME")
             )
 
+    _initialised_engine = engine
+
 
 def reset_database_state() -> None:
     """Reset the cached engine (useful for tests)."""
 
-    global _engine
+    global _engine, _initialised_engine
     _engine = None
+    _initialised_engine = None
@@ -19,7 +19,7 @@ from .prompt import build_prompt
 from .validators import (
     detect_bad_label,
     extract_fenced_simpleheaders_block,
-    parse_fenced_payload,
+    parse_simpleheaders_block,
 )
 
 try:  # pragma: no cover - avoid circular import failures during packaging
@@ -167,7 +167,7 @@ async def _invoke_single(
             else:
                 fenced_blocks.append(block)
                 try:
-                    headers = parse_fenced_payload(raw_text)
+                    headers = parse_simpleheaders_block(block)
                 except ValueError as exc:
                     reason = exc.args[0] if exc.args else "invalid_json"
                 else:
@@ -8,6 +8,11 @@ from typing import Any, List
 
 from .models import HeaderItem
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
 _FENCE_RE = re.compile(r"```SIMPLEHEADERS\s*(?:\r?\n)(.*?)(?:\r?\n)?```", re.DOTALL)
 _ANY_FENCE_RE = re.compile(r"```([A-Za-z0-9_-]+)")
 
@@ -95,17 +100,33 @@ def validate_headers_json(obj: Any) -> List[HeaderItem]:
     return cleaned
 
 
+def _loads(block: str) -> Any:
+    """Decode *block* with orjson when available, else the stdlib parser."""
+
+    if orjson is not None:
+        return orjson.loads(block)
+    return json.loads(block)
+
+
+def parse_simpleheaders_block(block: str) -> List[HeaderItem]:
+    """Decode and validate an already extracted SIMPLEHEADERS *block*."""
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except
+    # clause covers both parsers.
+    try:
+        payload = _loads(block)
+    except json.JSONDecodeError as exc:
+        raise ValueError("invalid_json") from exc
+    return validate_headers_json(payload)
+
+
 def parse_fenced_payload(text: str) -> List[HeaderItem]:
     """Extract and validate the SIMPLEHEADERS block from *text*."""
 
     block = extract_fenced_simpleheaders_block(text)
     if block is None:
         raise ValueError("missing_fence")
-    try:
-        payload = json.loads(block)
-    except json.JSONDecodeError as exc:  # pragma: no cover - handled in tests
-        raise ValueError("invalid_json") from exc
-    return validate_headers_json(payload)
+    return parse_simpleheaders_block(block)
 
 
 __all__ = [
@@ -113,4 +134,5 @@ __all__ = [
     "extract_fenced_simpleheaders_block",
     "validate_headers_json",
     "parse_fenced_payload",
+    "parse_simpleheaders_block",
 ]
@@ -36,8 +36,13 @@ def _normalise_inputs(inputs: Mapping[str, Any]) -> str:
     """Return a deterministic JSON serialisation for hashing purposes."""
 
     def _default(value: Any) -> Any:  # noqa: ANN401 - json fallback hook
-        if isinstance(value, set):
-            return sorted(value)
+        if isinstance(value, (set, frozenset)):
+            try:
+                return sorted(value)
+            except TypeError:
+                # Mixed element types: order by type name, then text, so
+                # elements like 1 and "1" never tie on set-iteration order.
+                return sorted(value, key=lambda item: (type(item).__name__, str(item)))
         if isinstance(value, (datetime,)):
             return value.isoformat()
         if isinstance(value, Path):
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 import time
 from typing import Iterable, Mapping, Sequence
@@ -73,9 +72,7 @@ def _persist_trace(tracer: HeaderTracer, *, write_trace_json: bool) -> str | Non
     if write_trace_json:
         return tracer.flush_jsonl()
 
-    summary_payload = tracer._build_summary()  # noqa: SLF001 - internal helper
-    with open(tracer.summary_path, "w", encoding="utf-8") as handle:
-        json.dump(summary_payload, handle, ensure_ascii=False, indent=2)
+    tracer.flush_summary()
     return None
 
 
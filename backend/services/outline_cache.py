@@ -6,6 +6,7 @@ import hashlib
 import json
 from typing import Any, Optional
 
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from ..models import HeaderOutlineCache, HeaderOutlineRun
@@ -28,6 +29,7 @@ def supersede_previous_runs(
     document_id: int,
     *,
     exclude_run_id: int | None = None,
+    commit: bool = True,
 ) -> None:
     """Mark completed runs for ``document_id`` as superseded.
 
@@ -39,29 +41,25 @@ def supersede_previous_runs(
         Identifier of the document whose runs should be superseded.
     exclude_run_id:
         Optional run identifier that should remain marked as ``completed``.
+    commit:
+        Commit the update immediately. Callers batching several writes into
+        one transaction pass ``False`` and commit themselves.
     """
 
-    runs = session.exec(
-        select(HeaderOutlineRun).where(
+    statement = (
+        update(HeaderOutlineRun)
+        .where(
             HeaderOutlineRun.document_id == document_id,
             HeaderOutlineRun.status == "completed",
         )
-    ).all()
-    if not runs:
-        return
-
-    touched = False
-    for run in runs:
-        if exclude_run_id is not None and int(run.id or 0) == exclude_run_id:
-            continue
-        run.status = "superseded"
-        touched = True
-
-    if not touched:
-        return
+        .values(status="superseded")
+    )
+    if exclude_run_id is not None:
+        statement = statement.where(HeaderOutlineRun.id != exclude_run_id)
 
-    session.add_all(runs)
-    session.commit()
+    result = session.exec(statement)
+    if result.rowcount and commit:
+        session.commit()
 
 
 def persist_outline_cache(
@@ -117,7 +115,12 @@ def persist_outline_cache(
         session.flush()
 
     if supersede_old:
-        supersede_previous_runs(session, document_id, exclude_run_id=int(run.id or 0))
+        supersede_previous_runs(
+            session,
+            document_id,
+            exclude_run_id=int(run.id or 0),
+            commit=False,
+        )
 
     cache = session.exec(
         select(HeaderOutlineCache)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import os
 import re
 import time
 from dataclasses import dataclass
@@ -302,7 +303,10 @@ async def get_headers_llm_full(
     # --------- Write cache (best-effort) ----------
     if cache_file is not None:
         try:
-            cache_file.write_text(
+            # Write to a sibling temp file and swap it in so an interrupted run
+            # never leaves a truncated cache entry behind.
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_text(
                 json.dumps(
                     {
                         "headers": deduped,
@@ -314,6 +318,7 @@ async def get_headers_llm_full(
                 ),
                 encoding="utf-8",
             )
+            os.replace(tmp_file, cache_file)
             if tracer is not None:
                 tracer.ev("llm_cache_write", path=str(cache_file))
         except Exception:
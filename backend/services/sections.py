@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Mapping, Sequence
 
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlmodel import Session, select
 
 from ..models import DocumentSection
@@ -269,9 +269,8 @@ def persist_sections(
     session.exec(
         delete(DocumentSection).where(DocumentSection.document_id == document_id)
     )
-    created: list[DocumentSection] = []
-    for span in spans:
-        section = DocumentSection(
+    sections = [
+        DocumentSection(
             document_id=document_id,
             section_key=str(span["section_key"]),
             title=str(span.get("title", "")),
@@ -282,12 +281,24 @@ def persist_sections(
             start_page=_safe_int(span.get("start_page")),
             end_page=_safe_int(span.get("end_page")),
         )
-        session.add(section)
-        created.append(section)
+        for span in spans
+    ]
+    if sections:
+        # A single executemany INSERT; the ORM would emit (and track) one
+        # statement per row to fetch each primary key.
+        session.exec(
+            insert(DocumentSection),
+            params=[section.model_dump(exclude={"id"}) for section in sections],
+        )
     session.commit()
-    for section in created:
-        session.refresh(section)
-    return created
+    # One SELECT loads the stored rows instead of a refresh per section.
+    return list(
+        session.exec(
+            select(DocumentSection)
+            .where(DocumentSection.document_id == document_id)
+            .order_by(DocumentSection.id)
+        ).all()
+    )
 
 
 def build_and_store_sections(
@@ -38,5 +38,11 @@ class SimpleHeadersState:
 
         cls._store.pop(document_id, None)
 
+    @classmethod
+    def reset(cls) -> None:
+        """Drop every cached entry by swapping in a fresh store."""
+
+        cls._store = OrderedDict()
+
 
 __all__ = ["SimpleHeadersState"]
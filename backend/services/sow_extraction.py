@@ -7,6 +7,7 @@ import json
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Iterable, Mapping, Sequence
 
 from sqlalchemy import desc, select
@@ -166,8 +167,7 @@ def parse_sow_steps(
     for index, entry in enumerate(raw_steps, start=1):
         if not isinstance(entry, Mapping):
             continue
-        order_value = entry.get("order") or entry.get("order_index")
-        order = _coerce_int(order_value)
+        order = _coerce_int(entry.get("order") or entry.get("order_index"))
         if order is None or order <= 0:
             order = _next_available_index(fallback_order, used_indices)
             fallback_order = order + 1
@@ -175,69 +175,58 @@ def parse_sow_steps(
             order = _next_available_index(order, used_indices)
         used_indices.add(order)
 
-        title = _coerce_str(entry.get("title"))
-        description = _coerce_str(entry.get("description"))
-        if description and not title:
-            title = description.splitlines()[0]
-        if title and not description:
-            description = title
-        if not description:
-            continue
-        if not title:
-            title = f"Step {order}"
-
-        step_id = (
-            _coerce_str(entry.get("id"))
-            or _coerce_str(entry.get("step_id"))
-            or _fallback_step_id(chunk_index, index)
-        )
-        label = _coerce_str(entry.get("label"))
-        phase = _coerce_str(entry.get("phase"))
-        source_page_start = _coerce_int(
-            entry.get("source_page_start") or entry.get("start_page")
-        )
-        source_page_end = _coerce_int(
-            entry.get("source_page_end") or entry.get("end_page")
-        )
-        source_section_title = _coerce_str(
-            entry.get("source_section_title") or entry.get("header_section_key")
-        )
-
-        processed.append(
-            ProcessStep(
-                id=step_id,
-                order=int(order),
-                phase=phase,
-                label=label,
-                title=title,
-                description=description,
-                source_page_start=source_page_start,
-                source_page_end=source_page_end,
-                source_section_title=source_section_title,
-            )
-        )
+        step = _normalise_step(entry, order, chunk_index=chunk_index, index=index)
+        if step is not None:
+            processed.append(step)
 
     if not processed:
         raise SOWExtractionError("LLM response did not contain any valid steps")
 
-    processed.sort(key=lambda step: (step.order, step.id))
-    normalised: list[ProcessStep] = []
-    for idx, step in enumerate(processed, start=1):
-        normalised.append(
-            ProcessStep(
-                id=step.id,
-                order=idx,
-                phase=step.phase,
-                label=step.label,
-                title=step.title,
-                description=step.description,
-                source_page_start=step.source_page_start,
-                source_page_end=step.source_page_end,
-                source_section_title=step.source_section_title,
-            )
-        )
+    processed.sort(key=attrgetter("order", "id"))
+    return [
+        step.model_copy(update={"order": idx})
+        for idx, step in enumerate(processed, start=1)
+    ]
 
-    return normalised
+
+def _normalise_step(
+    entry: Mapping[str, object], order: int, *, chunk_index: int, index: int
+) -> ProcessStep | None:
+    """Build a :class:`ProcessStep` from ``entry`` or ``None`` if it has no text."""
+
+    title = _coerce_str(entry.get("title"))
+    description = _coerce_str(entry.get("description"))
+    if description and not title:
+        title = description.splitlines()[0]
+    if title and not description:
+        description = title
+    if not description:
+        return None
+    if not title:
+        title = f"Step {order}"
+
+    step_id = (
+        _coerce_str(entry.get("id"))
+        or _coerce_str(entry.get("step_id"))
+        or _fallback_step_id(chunk_index, index)
+    )
+    return ProcessStep(
+        id=step_id,
+        order=order,
+        phase=_coerce_str(entry.get("phase")),
+        label=_coerce_str(entry.get("label")),
+        title=title,
+        description=description,
+        source_page_start=_coerce_int(
+            entry.get("source_page_start") or entry.get("start_page")
+        ),
+        source_page_end=_coerce_int(
+            entry.get("source_page_end") or entry.get("end_page")
+        ),
+        source_section_title=_coerce_str(
+            entry.get("source_section_title") or entry.get("header_section_key")
+        ),
+    )
 
 
 def _invoke_llm(
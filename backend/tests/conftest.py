@@ -0,0 +1,132 @@
+"""Shared fixtures for the backend test-suite."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from backend import database
+from backend.migrations import run_migrations
+
+PDF_STUB_BYTES = b"%PDF-1.4\n%EOF"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(scope="session")
+def _pdf_stub(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the placeholder PDF once per session."""
+
+    path = tmp_path_factory.mktemp("pdf-stub") / "doc.pdf"
+    path.write_bytes(PDF_STUB_BYTES)
+    return path
+
+
+@pytest.fixture()
+def stub_pdf_at(_pdf_stub: Path) -> Callable[..., Path]:
+    """Return a helper that stages the placeholder PDF inside a document dir.
+
+    The session file is hard-linked where possible; filesystems without
+    hard-link support fall back to writing the bytes.
+    """
+
+    def _stage(doc_dir: Path, name: str = "doc.pdf") -> Path:
+        target = doc_dir / name
+        try:
+            os.link(_pdf_stub, target)
+        except OSError:
+            target.write_bytes(PDF_STUB_BYTES)
+        return target
+
+    return _stage
+
+
+@pytest.fixture(scope="session")
+def mfc_pdf_path() -> Path:
+    """Return the MFC-5M sample PDF, skipping dependants when it is absent.
+
+    The path is resolved and stat-ed once; pytest caches the skip for the
+    rest of the session.
+    """
+
+    pdf_path = REPO_ROOT / "MFC-5M_R2001_E1985.pdf"
+    if not pdf_path.is_file():
+        pytest.skip("Sample document MFC-5M_R2001_E1985.pdf missing")
+    return pdf_path
+
+
+@pytest.fixture(scope="session")
+def shared_engine() -> Iterator[Engine]:
+    """Return one in-memory engine whose schema is created once per session."""
+
+    from backend.models import (  # noqa: F401  Ensures models are registered with SQLModel metadata.
+        artifacts,
+        document,
+        header_anchor,
+        header_outline,
+        section,
+        sow,
+    )
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT semantics;
+    # hand BEGIN over to SQLAlchemy so nested transactions behave.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _record):  # noqa: ANN001
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):  # noqa: ANN001
+        connection.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def db_session(shared_engine: Engine) -> Iterator[Session]:
+    """Yield a session whose writes are rolled back after the test.
+
+    ``session.commit()`` only releases a SAVEPOINT, so code under test can
+    commit freely without leaking rows into later tests.
+    """
+
+    connection = shared_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture()
+def use_shared_engine(
+    monkeypatch: pytest.MonkeyPatch, shared_engine: Engine
+) -> Iterator[Engine]:
+    """Route ``database.get_engine`` to the shared engine for app-level tests.
+
+    Requests served through the app commit on their own sessions, so the
+    tables are emptied afterwards instead of rolling back.
+    """
+
+    monkeypatch.setattr(database, "get_engine", lambda: shared_engine)
+    yield shared_engine
+    with shared_engine.begin() as connection:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            connection.execute(table.delete())
@@ -114,3 +114,31 @@ def test_store_artifact_reuses_existing_entry() -> None:
         assert fetched.id == first.id
         assert fetched.body.get("headers") == []
 
+
+def test_cached_artifact_accepts_mixed_type_set_inputs() -> None:
+    session = _make_session()
+    with session:
+        document = Document(filename="doc.pdf", checksum="ghi")
+        session.add(document)
+        session.commit()
+        session.refresh(document)
+
+        stored = store_artifact(
+            session=session,
+            document_id=document.id,
+            artifact_type=DocumentArtifactType.HEADER_TREE,
+            key="llm_full",
+            inputs={"excluded_pages": {3, "cover", 1, "1"}},
+            body={"headers": []},
+        )
+
+        fetched = get_cached_artifact(
+            session=session,
+            document_id=document.id,
+            artifact_type=DocumentArtifactType.HEADER_TREE,
+            key="llm_full",
+            inputs={"excluded_pages": {"1", "cover", 1, 3}},
+        )
+
+        assert fetched is not None
+        assert fetched.id == stored.id
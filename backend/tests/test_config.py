@@ -57,3 +57,20 @@ def test_openrouter_api_key_loaded_from_env_file(monkeypatch, tmp_path):
     assert settings.openrouter_api_key == "file-value"
 
     monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+
+
+def test_reset_settings_cache_rebuilds_when_env_changes(monkeypatch):
+    """Changing a settings variable should produce a fresh instance."""
+
+    monkeypatch.setenv("HEADERS_MODE", "llm_full")
+    config.reset_settings_cache()
+    first = config.get_settings()
+
+    monkeypatch.setenv("HEADERS_MODE", "llm_simple")
+    assert config.get_settings() is first
+
+    config.reset_settings_cache()
+    refreshed = config.get_settings()
+
+    assert refreshed is not first
+    assert refreshed.headers_mode == "llm_simple"
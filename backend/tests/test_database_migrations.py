@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from backend import database
@@ -68,3 +69,49 @@ def test_init_db_creates_sow_tables(tmp_path, monkeypatch):
 
     assert "sow_runs" in tables
     assert "sow_steps" in tables
+
+
+def test_in_memory_engine_shares_tables_across_threads(monkeypatch):
+    """An in-memory URL should expose one database to every connection."""
+
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    database.reset_database_state()
+    reset_settings_cache()
+
+    database.init_db()
+    engine = database.get_engine()
+
+    def _list_tables() -> set[str]:
+        with engine.connect() as connection:
+            return {
+                row[0]
+                for row in connection.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            }
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tables = executor.submit(_list_tables).result()
+
+    assert "document" in tables
+    database.reset_database_state()
+
+
+def test_init_db_runs_ddl_once_per_engine(tmp_path, monkeypatch):
+    """Repeat ``init_db`` calls on one engine should skip the schema setup."""
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'once.db'}")
+    database.reset_database_state()
+    reset_settings_cache()
+
+    calls: list[object] = []
+    monkeypatch.setattr(database, "run_migrations", calls.append)
+
+    database.init_db()
+    database.init_db()
+    assert len(calls) == 1
+
+    database.reset_database_state()
+    database.init_db()
+    assert len(calls) == 2
+    database.reset_database_state()
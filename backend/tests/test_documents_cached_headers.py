@@ -34,7 +34,6 @@ def _prepare_runtime(monkeypatch, tmp_path):
     init_db()
 
     engine = get_engine()
-    SimpleHeadersState.clear()
     return settings, engine
 
 
@@ -238,8 +237,6 @@ def test_cached_headers_fallbacks_when_lines_missing(monkeypatch, tmp_path) -> N
     assert cached[0] == "rehydrate"
     assert cached[1] == lines
 
-    SimpleHeadersState.clear()
-
 
 def test_cached_headers_recall_across_documents(monkeypatch, tmp_path) -> None:
     """Switching between documents should preserve and rehydrate cached headers."""
@@ -417,5 +414,3 @@ def test_cached_headers_recall_across_documents(monkeypatch, tmp_path) -> None:
         )
         assert section_response_b.status_code == 200
         assert section_response_b.text == "Doc B Heading\nDoc B Body"
-
-    SimpleHeadersState.clear()
@@ -1,5 +1,5 @@
-import asyncio
 import json
+import shutil
 from pathlib import Path
 
 import backend.config as app_config
@@ -7,10 +7,11 @@ from backend.config import Settings
 from backend.services import headers_orchestrator
 from backend.services.headers_llm_strict import extract_headers_and_sections_strict
 from backend.services.pdf_headers_llm_full import LLMFullHeadersResult
+from backend.utils import trace as trace_module
 from backend.utils.trace import HeaderTracer
 
 
-def test_header_trace_enabled(monkeypatch, tmp_path) -> None:
+async def test_header_trace_enabled(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(app_config, "HEADERS_TRACE", True)
     monkeypatch.setattr(app_config, "HEADERS_TRACE_DIR", str(tmp_path))
     monkeypatch.setattr(app_config, "HEADERS_TRACE_EMBED_RESPONSE", False)
@@ -66,14 +67,12 @@ def test_header_trace_enabled(monkeypatch, tmp_path) -> None:
     )
 
     settings = Settings(headers_mode="llm_full", upload_dir=tmp_path)
-    payload, tracer = asyncio.run(
-        headers_orchestrator.extract_headers_and_chunks(
-            b"pdf-bytes",
-            settings=settings,
-            native_headers=[{"text": "Introduction", "number": "1", "level": 1}],
-            metadata={},
-            want_trace=True,
-        )
+    payload, tracer = await headers_orchestrator.extract_headers_and_chunks(
+        b"pdf-bytes",
+        settings=settings,
+        native_headers=[{"text": "Introduction", "number": "1", "level": 1}],
+        metadata={},
+        want_trace=True,
     )
 
     assert tracer is not None
@@ -132,7 +131,7 @@ def test_header_trace_enabled(monkeypatch, tmp_path) -> None:
     )
 
 
-def test_header_trace_summary_created_by_default(monkeypatch, tmp_path) -> None:
+async def test_header_trace_summary_created_by_default(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(app_config, "HEADERS_TRACE", False)
     monkeypatch.setattr(app_config, "HEADERS_TRACE_DIR", str(tmp_path))
     monkeypatch.setattr(app_config, "HEADERS_TRACE_EMBED_RESPONSE", False)
@@ -188,13 +187,11 @@ def test_header_trace_summary_created_by_default(monkeypatch, tmp_path) -> None:
     )
 
     settings = Settings(headers_mode="llm_full", upload_dir=tmp_path)
-    payload, tracer = asyncio.run(
-        headers_orchestrator.extract_headers_and_chunks(
-            b"pdf-bytes",
-            settings=settings,
-            native_headers=[{"text": "Intro", "number": "1", "level": 1}],
-            metadata={},
-        )
+    payload, tracer = await headers_orchestrator.extract_headers_and_chunks(
+        b"pdf-bytes",
+        settings=settings,
+        native_headers=[{"text": "Intro", "number": "1", "level": 1}],
+        metadata={},
     )
 
     assert tracer is not None
@@ -256,3 +253,58 @@ def test_header_trace_events_emitted_for_strict_mode(tmp_path) -> None:
     event_types = {event["type"] for event in events}
     assert "llm_outline_received" in event_types
     assert "candidate_found" in event_types
+
+
+def test_header_trace_streams_jsonl_in_batches(tmp_path) -> None:
+    tracer = HeaderTracer(run_id="streamed", out_dir=str(tmp_path), flush_every=2)
+    trace_path = Path(tracer.path)
+
+    tracer.ev("start_run", mode="llm_full")
+    assert not trace_path.exists()
+
+    tracer.log_call("backend.services.pdf_native.collect_line_metrics")
+    assert len(trace_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    tracer.ev("candidate_found", text="1 Introduction")
+    tracer.flush_jsonl()
+
+    lines = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert lines == tracer.as_list()
+    summary = json.loads(Path(tracer.summary_path).read_text(encoding="utf-8"))
+    assert summary["metadata"] == {"mode": "llm_full"}
+    assert [entry["type"] for entry in summary["decisions"]] == ["candidate_found"]
+
+
+def test_header_trace_stdlib_fallback_matches_orjson_output(monkeypatch, tmp_path) -> None:
+    tracer = HeaderTracer(run_id="fallback", out_dir=str(tmp_path))
+    tracer.ev("start_run", mode="llm_full", title="Überblick")
+    tracer.ev("line_index_map_built", pages={1: 3}, indexed_count=3)
+    tracer.ev("candidate_found", text="1 Introduction", score=0.5)
+
+    trace_path = Path(tracer.path)
+    summary_path = Path(tracer.summary_path)
+    tracer.flush_jsonl()
+    expected_lines = trace_path.read_bytes()
+    expected_summary = summary_path.read_bytes()
+
+    monkeypatch.setattr(trace_module, "orjson", None)
+    tracer.flush_jsonl()
+
+    assert trace_path.read_bytes() == expected_lines
+    assert summary_path.read_bytes() == expected_summary
+    lines = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["title"] == "Überblick"
+    assert lines[1]["pages"] == {"1": 3}
+
+
+def test_header_trace_recreates_removed_output_dir(tmp_path) -> None:
+    out_dir = tmp_path / "logs" / "headers"
+    HeaderTracer(run_id="first", out_dir=str(out_dir)).flush_jsonl()
+    shutil.rmtree(out_dir)
+
+    tracer = HeaderTracer(run_id="second", out_dir=str(out_dir))
+    tracer.ev("start_run", mode="llm_full")
+    tracer.flush_jsonl()
+
+    assert Path(tracer.path).exists()
+    assert Path(tracer.summary_path).exists()
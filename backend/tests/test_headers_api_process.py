@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-import types
+from dataclasses import dataclass
 
 from sqlmodel import Session
 
@@ -13,14 +12,48 @@ from backend.services.headers import HeaderExtractionResult, HeaderNode
 from backend.services.simpleheaders_state import SimpleHeadersState
 
 
-def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
+@dataclass(frozen=True, slots=True)
+class _SectionStub:
+    section_key: str = "sec-1"
+    title: str = "Intro"
+    number: str = "1"
+    level: int = 1
+    start_global_idx: int = 0
+    end_global_idx: int = 2
+    start_page: int = 0
+    end_page: int = 0
+
+
+class DummyTracer:
+    path = "trace.jsonl"
+    summary_path = "trace.summary.json"
+
+    @staticmethod
+    def as_list():  # noqa: ANN205
+        return []
+
+    @staticmethod
+    def log_call(*args, **kwargs):  # noqa: ANN205
+        return None
+
+    @staticmethod
+    def ev(*args, **kwargs):  # noqa: ANN205
+        return None
+
+
+_SECTION_STUB = _SectionStub()
+_DUMMY_TRACER = DummyTracer()
+
+
+async def test_extract_headers_and_chunks_force_refresh(
+    monkeypatch, tmp_path, stub_pdf_at
+):
     """The API helper should honour the end-to-end header extraction process."""
 
     monkeypatch.setenv("HEADERS_MODE", "llm_full")
-    db_path = tmp_path / "test.db"
     upload_dir = tmp_path / "uploads"
     export_dir = tmp_path / "exports"
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
     monkeypatch.setenv("UPLOAD_DIR", str(upload_dir))
     monkeypatch.setenv("EXPORT_DIR", str(export_dir))
     monkeypatch.setenv("EXPORT_RETENTION_DAYS", "1")
@@ -41,8 +74,7 @@ def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
 
     document_dir = settings.upload_dir / str(document_id)
     document_dir.mkdir(parents=True, exist_ok=True)
-    pdf_path = document_dir / "doc.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4\n%EOF")
+    stub_pdf_at(document_dir)
 
     SimpleHeadersState.set(document_id, "stale-hash", [{"global_idx": 999}])
 
@@ -75,17 +107,6 @@ def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
         lambda *args, **kwargs: header_result,
     )
 
-    section_stub = types.SimpleNamespace(
-        section_key="sec-1",
-        title="Intro",
-        number="1",
-        level=1,
-        start_global_idx=0,
-        end_global_idx=2,
-        start_page=0,
-        end_page=0,
-    )
-
     captured: dict[str, object] = {}
 
     def _fake_build_and_store_sections(
@@ -97,26 +118,13 @@ def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
     ):  # noqa: ANN001
         captured["simpleheaders"] = list(simpleheaders)
         captured["lines"] = list(lines)
-        return [section_stub]
+        return [_SECTION_STUB]
 
     monkeypatch.setattr(
         "backend.api.headers.build_and_store_sections",
         _fake_build_and_store_sections,
     )
 
-    class DummyTracer:
-        path = "trace.jsonl"
-        summary_path = "trace.summary.json"
-
-        def as_list(self):  # noqa: ANN201
-            return []
-
-        def log_call(self, *args, **kwargs):  # noqa: ANN201
-            return None
-
-        def ev(self, *args, **kwargs):  # noqa: ANN201
-            return None
-
     async def _fake_orchestrator(
         document_bytes: bytes,
         *,
@@ -168,7 +176,7 @@ def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
                     {"text": "Body", "page": 0, "line_idx": 1, "global_idx": 1},
                 ],
             },
-            DummyTracer(),
+            _DUMMY_TRACER,
         )
 
     monkeypatch.setattr(
@@ -180,17 +188,14 @@ def test_extract_headers_and_chunks_force_refresh(monkeypatch, tmp_path):
         _fake_orchestrator,
     )
 
-    async def _run() -> dict:
-        with Session(engine) as session:
-            return await headers_api.extract_headers_and_chunks(
-                document_id=document_id,
-                settings=settings,
-                session=session,
-                force=True,
-                trace=False,
-            )
-
-    response = asyncio.run(_run())
+    with Session(engine) as session:
+        response = await headers_api.extract_headers_and_chunks(
+            document_id=document_id,
+            settings=settings,
+            session=session,
+            force=True,
+            trace=False,
+        )
 
     assert delete_called == [document_id]
     assert captured["force"] is True
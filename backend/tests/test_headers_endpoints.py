@@ -11,7 +11,19 @@ from backend.main import app
 from backend.models import Document, DocumentSection
 from backend.services.headers import HeaderExtractionResult, HeaderNode
 from backend.services.outline_cache import latest_outline_for_document, persist_outline_cache
-from backend.services.simpleheaders_state import SimpleHeadersState
+
+_SECTION_ROWS = (
+    {
+        "section_key": "intro",
+        "title": "Intro",
+        "number": "1",
+        "level": 1,
+        "start_global_idx": 0,
+        "end_global_idx": 2,
+        "start_page": 0,
+        "end_page": 0,
+    },
+)
 
 
 class DummyTracer:
@@ -29,11 +41,10 @@ class DummyTracer:
 
 
 def _setup_client(monkeypatch, tmp_path) -> tuple[TestClient, Session, object]:
-    db_path = tmp_path / "headers.db"
     upload_dir = tmp_path / "uploads"
     export_dir = tmp_path / "exports"
 
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
     monkeypatch.setenv("UPLOAD_DIR", str(upload_dir))
     monkeypatch.setenv("EXPORT_DIR", str(export_dir))
     monkeypatch.setenv("EXPORT_RETENTION_DAYS", "1")
@@ -45,12 +56,13 @@ def _setup_client(monkeypatch, tmp_path) -> tuple[TestClient, Session, object]:
     init_db()
 
     engine = get_engine()
-    SimpleHeadersState.clear()
 
     return TestClient(app), Session(engine), settings
 
 
-def test_post_headers_persists_outline_and_returns_db_payload(monkeypatch, tmp_path) -> None:
+def test_post_headers_persists_outline_and_returns_db_payload(
+    monkeypatch, tmp_path, stub_pdf_at
+) -> None:
     client, session, settings = _setup_client(monkeypatch, tmp_path)
 
     document = Document(filename="doc.pdf", checksum="abc123")
@@ -61,7 +73,7 @@ def test_post_headers_persists_outline_and_returns_db_payload(monkeypatch, tmp_p
 
     doc_dir = settings.upload_dir / str(document_id)
     doc_dir.mkdir(parents=True, exist_ok=True)
-    (doc_dir / "doc.pdf").write_bytes(b"%PDF-1.4\n%EOF")
+    stub_pdf_at(doc_dir)
 
     parse_result = object()
 
@@ -77,21 +89,13 @@ def test_post_headers_persists_outline_and_returns_db_payload(monkeypatch, tmp_p
     )
 
     def _fake_build_and_store_sections(*, session, document_id, simpleheaders, lines):  # noqa: ANN001
-        section = DocumentSection(
-            document_id=document_id,
-            section_key="intro",
-            title="Intro",
-            number="1",
-            level=1,
-            start_global_idx=0,
-            end_global_idx=2,
-            start_page=0,
-            end_page=0,
-        )
-        session.add(section)
+        sections = [
+            DocumentSection(document_id=document_id, **row) for row in _SECTION_ROWS
+        ]
+        # One transaction for every row, mirroring ``persist_sections``.
+        session.add_all(sections)
         session.commit()
-        session.refresh(section)
-        return [section]
+        return sections
 
     call_counter: list[str] = []
 
@@ -212,7 +216,7 @@ def test_post_headers_persists_outline_and_returns_db_payload(monkeypatch, tmp_p
     assert status_response.json() == {"parsed": True, "headers": True, "sow": False}
 
 
-def test_get_headers_404_when_absent(monkeypatch, tmp_path) -> None:
+def test_get_headers_404_when_absent(monkeypatch, tmp_path, stub_pdf_at) -> None:
     client, session, settings = _setup_client(monkeypatch, tmp_path)
 
     document = Document(filename="doc.pdf", checksum="missing")
@@ -223,7 +227,7 @@ def test_get_headers_404_when_absent(monkeypatch, tmp_path) -> None:
 
     doc_dir = settings.upload_dir / str(document_id)
     doc_dir.mkdir(parents=True, exist_ok=True)
-    (doc_dir / "doc.pdf").write_bytes(b"%PDF-1.4\n%EOF")
+    stub_pdf_at(doc_dir)
 
     status_response = client.get(f"/api/documents/{document_id}/status")
     assert status_response.status_code == 200
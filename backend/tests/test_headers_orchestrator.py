@@ -1,4 +1,6 @@
-import asyncio
+from typing import Iterator
+
+import pytest
 
 from backend.config import Settings
 from backend.services import headers_orchestrator
@@ -8,13 +10,15 @@ from backend.services.pdf_headers_llm_full import (
 )
 
 
-async def _run_extract(
-    monkeypatch,
-    tmp_path,
-    *,
-    llm_exception: Exception | None = None,
-    strict_mode: bool = False,
-):
+@pytest.fixture(scope="module")
+def orch_stubs() -> Iterator[dict]:
+    """Stub the orchestrator dependencies once for the whole module.
+
+    The yielded dict is read by the LLM stub, so each test can choose the
+    exception it raises without re-patching the module.
+    """
+
+    state: dict = {"llm_exception": None}
     lines = [
         {
             "text": "Intro",
@@ -49,6 +53,7 @@ async def _run_extract(
                 params={},
                 messages=[{"role": "user", "content": "stub"}],
             )
+        llm_exception = state["llm_exception"]
         if llm_exception is not None:
             raise llm_exception
         return LLMFullHeadersResult(
@@ -96,41 +101,52 @@ async def _run_extract(
             }
         ]
 
-    monkeypatch.setattr(
-        "backend.services.headers_orchestrator.collect_line_metrics", _fake_collect
-    )
-    monkeypatch.setattr(
-        "backend.services.headers_orchestrator.get_headers_llm_full", _fake_llm
-    )
-    monkeypatch.setattr(
-        "backend.services.headers_orchestrator.locate_headers_in_lines", _fake_locate
-    )
-    monkeypatch.setattr(
-        "backend.services.headers_orchestrator.single_chunks_from_headers", _fake_chunks
-    )
-    monkeypatch.setattr(
-        "backend.services.headers_orchestrator.align_headers_llm_strict",
-        lambda headers, _lines, tracer=None: [
-            {
-                "header": {
-                    "text": header.get("text"),
-                    "number": header.get("number"),
-                    "level": header.get("level"),
-                    "_orig_index": idx,
-                },
-                "line": {
-                    "page": 0,
-                    "line_idx": 0,
-                    "global_idx": idx,
-                },
-                "score": 1.0,
-                "strategy": "unit-test",
-                "band": False,
-            }
-            for idx, header in enumerate(headers)
-        ],
-    )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            "backend.services.headers_orchestrator.collect_line_metrics", _fake_collect
+        )
+        monkeypatch.setattr(
+            "backend.services.headers_orchestrator.get_headers_llm_full", _fake_llm
+        )
+        monkeypatch.setattr(
+            "backend.services.headers_orchestrator.locate_headers_in_lines", _fake_locate
+        )
+        monkeypatch.setattr(
+            "backend.services.headers_orchestrator.single_chunks_from_headers", _fake_chunks
+        )
+        monkeypatch.setattr(
+            "backend.services.headers_orchestrator.align_headers_llm_strict",
+            lambda headers, _lines, tracer=None: [
+                {
+                    "header": {
+                        "text": header.get("text"),
+                        "number": header.get("number"),
+                        "level": header.get("level"),
+                        "_orig_index": idx,
+                    },
+                    "line": {
+                        "page": 0,
+                        "line_idx": 0,
+                        "global_idx": idx,
+                    },
+                    "score": 1.0,
+                    "strategy": "unit-test",
+                    "band": False,
+                }
+                for idx, header in enumerate(headers)
+            ],
+        )
+        yield state
+
 
+async def _run_extract(
+    orch_stubs: dict,
+    tmp_path,
+    *,
+    llm_exception: Exception | None = None,
+    strict_mode: bool = False,
+):
+    orch_stubs["llm_exception"] = llm_exception
     settings = Settings(
         upload_dir=tmp_path, headers_mode="llm_full", headers_llm_strict=strict_mode
     )
@@ -144,36 +160,34 @@ async def _run_extract(
     return result
 
 
-def test_extract_headers_llm_failure_emits_message(monkeypatch, tmp_path) -> None:
-    result = asyncio.run(
-        _run_extract(
-            monkeypatch,
-            tmp_path,
-            llm_exception=RuntimeError("OpenRouter HTTP 403: Forbidden"),
-        )
+async def test_extract_headers_llm_failure_emits_message(orch_stubs, tmp_path) -> None:
+    result = await _run_extract(
+        orch_stubs,
+        tmp_path,
+        llm_exception=RuntimeError("OpenRouter HTTP 403: Forbidden"),
     )
 
     assert result["mode"] == "llm_full_error"
-    assert result["messages"]
-    assert "HTTP 403" in result["messages"][0]
+    assert result["messages"] == [
+        "LLM header extraction unavailable (HTTP 403). "
+        "Verify the OpenRouter API key and referer configuration."
+    ]
     assert result["llm_headers"] == []
     assert result["llm_raw_responses"] == []
     assert result["llm_fenced_blocks"] == []
 
 
-def test_extract_headers_llm_parse_error_returns_raw(monkeypatch, tmp_path) -> None:
+async def test_extract_headers_llm_parse_error_returns_raw(orch_stubs, tmp_path) -> None:
     raw_payload = "LLM output without fences"
 
-    result = asyncio.run(
-        _run_extract(
-            monkeypatch,
-            tmp_path,
-            llm_exception=LLMFullHeadersParseError(
-                "missing fences",
-                content=raw_payload,
-                part_index=1,
-            ),
-        )
+    result = await _run_extract(
+        orch_stubs,
+        tmp_path,
+        llm_exception=LLMFullHeadersParseError(
+            "missing fences",
+            content=raw_payload,
+            part_index=1,
+        ),
     )
 
     assert result["mode"] == "llm_full_error"
@@ -187,8 +201,8 @@ def test_extract_headers_llm_parse_error_returns_raw(monkeypatch, tmp_path) -> N
     assert result["llm_fenced_blocks"] == []
 
 
-def test_extract_headers_llm_success_has_no_messages(monkeypatch, tmp_path) -> None:
-    result = asyncio.run(_run_extract(monkeypatch, tmp_path))
+async def test_extract_headers_llm_success_has_no_messages(orch_stubs, tmp_path) -> None:
+    result = await _run_extract(orch_stubs, tmp_path)
 
     assert result["mode"] == "llm_full"
     assert result["messages"] == []
@@ -199,11 +213,12 @@ def test_extract_headers_llm_success_has_no_messages(monkeypatch, tmp_path) -> N
     assert result["llm_fenced_blocks"]
 
 
-def test_extract_headers_strict_mode(monkeypatch, tmp_path) -> None:
-    result = asyncio.run(_run_extract(monkeypatch, tmp_path, strict_mode=True))
+async def test_extract_headers_strict_mode(orch_stubs, tmp_path) -> None:
+    result = await _run_extract(orch_stubs, tmp_path, strict_mode=True)
 
     assert result["mode"] == "llm_strict"
     assert result["messages"] == []
     assert result["fenced_text"]
     assert result["llm_headers"]
+    assert result["llm_headers"][0]["text"] == "Intro"
     assert result["llm_raw_responses"] == ["raw-response"]
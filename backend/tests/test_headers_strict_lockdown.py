@@ -1,9 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-import pytest
-
 from backend.services.headers_llm_strict import (
     align_headers_llm_strict,
     normalize_strict_text,
@@ -114,13 +110,8 @@ def test_toc_gating_and_last_occurrence() -> None:
     assert pages["4.2"] == 5
 
 
-def test_mfc_headers_align_with_golden_outline() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    pdf_path = repo_root / "MFC-5M_R2001_E1985.pdf"
-    if not pdf_path.exists():
-        pytest.skip("Sample document MFC-5M_R2001_E1985.pdf missing")
-
-    lines = parse_pdf_to_lines(pdf_path)
+def test_mfc_headers_align_with_golden_outline(mfc_pdf_path) -> None:
+    lines = parse_pdf_to_lines(mfc_pdf_path)
     for idx, line in enumerate(lines):
         line.setdefault("line_idx", idx)
 
@@ -1,4 +1,3 @@
-import asyncio
 import json
 
 from backend.config import Settings
@@ -85,7 +84,7 @@ def test_single_chunks_from_headers_avoids_overlap() -> None:
     assert chunks[1]["start_global_idx"] == 20
 
 
-def test_get_headers_llm_full_uses_cache(monkeypatch, tmp_path) -> None:
+async def test_get_headers_llm_full_uses_cache(monkeypatch, tmp_path) -> None:
     calls = 0
 
     def _fake_chat(messages, **kwargs):  # noqa: ANN001 - test stub
@@ -124,26 +123,23 @@ def test_get_headers_llm_full_uses_cache(monkeypatch, tmp_path) -> None:
         }
     ]
 
-    async def _run() -> None:
-        result = await get_headers_llm_full(
-            lines,
-            "hash-value",
-            settings=settings,
-            excluded_pages=set(),
-        )
+    result = await get_headers_llm_full(
+        lines,
+        "hash-value",
+        settings=settings,
+        excluded_pages=set(),
+    )
 
-        assert result.headers[0]["text"] == "Alpha"
-        assert result.fenced_blocks
-        assert result.raw_responses
+    assert result.headers[0]["text"] == "Alpha"
+    assert result.fenced_blocks
+    assert result.raw_responses
 
-        cached_result = await get_headers_llm_full(
-            lines,
-            "hash-value",
-            settings=settings,
-            excluded_pages=set(),
-        )
-
-        assert calls == 1
-        assert cached_result.headers == result.headers
+    cached_result = await get_headers_llm_full(
+        lines,
+        "hash-value",
+        settings=settings,
+        excluded_pages=set(),
+    )
 
-    asyncio.run(_run())
+    assert calls == 1
+    assert cached_result.headers == result.headers
@@ -4,7 +4,7 @@ from typing import Callable
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import delete
+from sqlalchemy import delete, func
 from sqlmodel import Session, select
 
 from backend.config import get_settings, reset_settings_cache
@@ -208,8 +208,10 @@ def test_parse_document_rehydrates_from_stored_pages(tmp_path: Path, monkeypatch
             assert payload["pages"][0]["is_toc"] is True
 
             with Session(engine) as session:
-                artifacts = session.exec(select(DocumentArtifact)).all()
-                assert len(artifacts) == 1
+                artifact_count = session.exec(
+                    select(func.count()).select_from(DocumentArtifact)
+                ).one()
+                assert artifact_count == 1
     finally:
         reset_settings_cache()
         reset_database_state()
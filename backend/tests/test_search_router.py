@@ -20,8 +20,7 @@ def test_search_endpoint_filters_by_section() -> None:
     with Session(engine) as session:
         document = Document(filename="sample.pdf", checksum="abc-search")
         session.add(document)
-        session.commit()
-        session.refresh(document)
+        session.flush()
         doc_id = int(document.id or 0)
         assert doc_id
 
@@ -47,8 +46,7 @@ def test_search_endpoint_filters_by_section() -> None:
             start_page=1,
             end_page=1,
         )
-        session.add(section_a)
-        session.add(section_b)
+        session.add_all([section_a, section_b])
         session.commit()
 
     lines = [
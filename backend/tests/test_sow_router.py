@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from typing import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
@@ -13,17 +15,67 @@ from backend.models import Document, DocumentPage
 from backend.services import sow_extraction
 from backend.services.llm import LLMResult
 
+FAKE_PAYLOAD = {
+    "steps": [
+        {
+            "order_index": 1,
+            "title": "Review requirements",
+            "description": "Review requirements",
+            "phase": "Design",
+            "start_page": 1,
+            "end_page": 1,
+        }
+    ]
+}
+
+
+class FakeLLM:
+    calls = 0
+
+    def __init__(self, *args, **kwargs):  # noqa: D401 - test stub
+        pass
+
+    @property
+    def is_enabled(self):  # noqa: D401 - test stub
+        return True
+
+    def generate(self, **kwargs):  # noqa: D401 - test stub
+        FakeLLM.calls += 1
+        return LLMResult(
+            content=f"{sow_extraction.PROMPT_FENCE} {json.dumps(FAKE_PAYLOAD)} {sow_extraction.PROMPT_FENCE}",
+            usage={"prompt_tokens": 10, "completion_tokens": 5},
+            cached=False,
+            fenced=json.dumps(FAKE_PAYLOAD),
+        )
+
+
+@pytest.fixture(scope="module")
+def client(shared_engine) -> Iterator[TestClient]:
+    """Start the application once for every router test in this module."""
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(database, "get_engine", lambda: shared_engine)
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture()
+def fake_llm(monkeypatch) -> type[FakeLLM]:
+    """Swap the SOW LLM service for :class:`FakeLLM` with a fresh call count."""
+
+    FakeLLM.calls = 0
+    monkeypatch.setattr(sow_extraction, "LLMService", FakeLLM)
+    return FakeLLM
+
 
-def test_sow_router_creates_and_reuses_run(tmp_path, monkeypatch) -> None:
+def test_sow_router_creates_and_reuses_run(
+    monkeypatch, use_shared_engine, client, fake_llm
+) -> None:
     """The /api/sow endpoints should create and reuse extraction runs."""
 
-    db_path = tmp_path / "sow.sqlite"
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
     monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test")
-    database.reset_database_state()
     reset_settings_cache()
-    database.init_db()
-    engine = database.get_engine()
+    engine = use_shared_engine
 
     with Session(engine) as session:
         document = Document(
@@ -32,8 +84,7 @@ def test_sow_router_creates_and_reuses_run(tmp_path, monkeypatch) -> None:
             last_parsed_at=datetime.now(UTC),
         )
         session.add(document)
-        session.commit()
-        session.refresh(document)
+        session.flush()
         doc_id = int(document.id or 0)
 
         session.add(
@@ -48,57 +99,22 @@ def test_sow_router_creates_and_reuses_run(tmp_path, monkeypatch) -> None:
         )
         session.commit()
 
-    fake_payload = {
-        "steps": [
-            {
-                "order_index": 1,
-                "title": "Review requirements",
-                "description": "Review requirements",
-                "phase": "Design",
-                "start_page": 1,
-                "end_page": 1,
-            }
-        ]
-    }
-
-    class FakeLLM:
-        calls = 0
-
-        def __init__(self, *args, **kwargs):  # noqa: D401 - test stub
-            pass
-
-        @property
-        def is_enabled(self):  # noqa: D401 - test stub
-            return True
-
-        def generate(self, **kwargs):  # noqa: D401 - test stub
-            FakeLLM.calls += 1
-            return LLMResult(
-                content=f"{sow_extraction.PROMPT_FENCE} {json.dumps(fake_payload)} {sow_extraction.PROMPT_FENCE}",
-                usage={"prompt_tokens": 10, "completion_tokens": 5},
-                cached=False,
-                fenced=json.dumps(fake_payload),
-            )
-
-    monkeypatch.setattr(sow_extraction, "LLMService", FakeLLM)
-
-    with TestClient(app) as client:
-        response = client.post(f"/api/sow/{doc_id}")
-        assert response.status_code == 200, response.text
-        payload = response.json()
-        assert payload["steps"], payload
-        assert payload["model"]
-        assert FakeLLM.calls == 1
-
-        reuse = client.post(f"/api/sow/{doc_id}")
-        assert reuse.status_code == 200
-        assert FakeLLM.calls == 1, "Existing runs should be reused when force=false"
-        assert reuse.json()["steps"], reuse.text
-
-        fetched = client.get(f"/api/sow/{doc_id}")
-        assert fetched.status_code == 200
-        assert fetched.json()["steps"], fetched.text
-
-        status_resp = client.get(f"/api/sow/{doc_id}/status")
-        assert status_resp.status_code == 200
-        assert status_resp.json()["sow"] is True
+    response = client.post(f"/api/sow/{doc_id}")
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["steps"], payload
+    assert payload["model"]
+    assert fake_llm.calls == 1
+
+    reuse = client.post(f"/api/sow/{doc_id}")
+    assert reuse.status_code == 200
+    assert fake_llm.calls == 1, "Existing runs should be reused when force=false"
+    assert reuse.json()["steps"], reuse.text
+
+    fetched = client.get(f"/api/sow/{doc_id}")
+    assert fetched.status_code == 200
+    assert fetched.json()["steps"], fetched.text
+
+    status_resp = client.get(f"/api/sow/{doc_id}/status")
+    assert status_resp.status_code == 200
+    assert status_resp.json()["sow"] is True
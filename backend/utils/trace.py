@@ -1,17 +1,91 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 from .logging import configure_logging
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
 
 LOGGER = configure_logging().getChild("headers.trace")
 
+# Bound once so ev() skips the attribute lookup on every event. Wall-clock time
+# (not monotonic) because "t" is written out as an epoch timestamp.
+_now = time.time
+
+# Streaming buffers larger than this are dropped after a write instead of
+# being cleared, so one oversized batch does not pin its memory for the run.
+_PENDING_SOFT_CAP = 128 * 1024
+
+# Events that the UI should consider "decisions" (show in the list)
+_DECISION_TYPES: frozenset[str] = frozenset(
+    {
+        # existing
+        "candidate_found",
+        "anchor_resolved",
+        "fallback_triggered",
+        "monotonic_violation",
+        # new chunking-related visibility
+        "chunking_start",
+        "line_index_map_built",
+        "header_missing_global",
+        "header_not_in_lines",
+        "chunk_bounds_resolved",
+        "chunk_skipped_inverted",
+        "chunk_built",
+        "chunking_complete",
+        # cache/info that influences behavior
+        "cache_purged",
+        "cache_bypassed",
+    }
+)
+
+
+# Keys copied from each ``llm_request`` event; "messages" is added separately
+# because it defaults to an empty list rather than None.
+_LLM_REQUEST_KEYS: tuple[str, ...] = (
+    "part",
+    "total_parts",
+    "model",
+    "temperature",
+    "timeout_read",
+    "params",
+)
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialise *payload* as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_pretty(payload: Any) -> bytes:
+    """Serialise *payload* as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    """Write *payload* to a sibling temp file and move it over *path*."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(payload)
+    os.replace(tmp_path, path)
+
 
 @dataclass(slots=True)
 class TraceEvent:
@@ -20,15 +94,55 @@ class TraceEvent:
     data: Dict[str, Any]
 
 
+class BuiltChunk(NamedTuple):
+    """Fixed-shape record of a ``chunk_built`` event for the chunking report."""
+
+    position: Optional[int]
+    header_text: Optional[str]
+    header_number: Optional[str]
+    level: Optional[int]
+    start_global_idx: Optional[int]
+    end_global_idx: Optional[int]
+    start_page: Optional[int]
+    end_page: Optional[int]
+    line_count: Optional[int]
+
+
 class HeaderTracer:
     """Collect structured events for header tracing (LLM + alignment + chunking)."""
 
+    __slots__ = (
+        "run_id",
+        "out_dir",
+        "flush_every",
+        "_t",
+        "_type",
+        "_data",
+        "_pending",
+        "_pending_count",
+        "_streamed",
+        "_path",
+        "_summary_path",
+    )
+
     def __init__(
-        self, run_id: Optional[str] = None, out_dir: str = "backend/logs/headers"
+        self,
+        run_id: Optional[str] = None,
+        out_dir: str = "backend/logs/headers",
+        flush_every: int = 0,
     ) -> None:
         self.run_id = run_id or str(uuid.uuid4())
         self.out_dir = out_dir
-        self.events: List[TraceEvent] = []
+        # When > 0, events are appended to the JSONL file in batches of this
+        # size as they arrive; the summary is still built by flush_jsonl().
+        self.flush_every = flush_every
+        # Events are stored column-wise; see ``events`` for a row view.
+        self._t: List[float] = []
+        self._type: List[str] = []
+        self._data: List[Dict[str, Any]] = []
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._streamed = False
         os.makedirs(self.out_dir, exist_ok=True)
         self._path = os.path.join(self.out_dir, f"{self.run_id}.jsonl")
         self._summary_path = os.path.join(self.out_dir, f"{self.run_id}.summary.json")
@@ -36,7 +150,16 @@ class HeaderTracer:
     # --- Emission API ---------------------------------------------------------
     def ev(self, event_type: str, **data: Any) -> None:
         """Record a generic event."""
-        self.events.append(TraceEvent(t=time.time(), type=event_type, data=data))
+        t = _now()
+        self._t.append(t)
+        self._type.append(event_type)
+        self._data.append(data)
+        if self.flush_every > 0:
+            self._pending += _dumps({"t": t, "type": event_type, **data})
+            self._pending += b"\n"
+            self._pending_count += 1
+            if self._pending_count >= self.flush_every:
+                self._write_pending()
 
     # Alias to support Protocol-style tracers (used by section_chunking.py)
     def emit(self, event_type: str, **data: Any) -> None:  # Protocol compat
@@ -47,18 +170,48 @@ class HeaderTracer:
         self.ev("function_call", name=name, **context)
     # -------------------------------------------------------------------------
 
+    def _write_pending(self) -> None:
+        """Append the buffered JSONL lines, truncating the file on first use."""
+        with open(self._path, "ab" if self._streamed else "wb") as handle:
+            handle.write(self._pending)
+        self._streamed = True
+        self._pending_count = 0
+        if len(self._pending) > _PENDING_SOFT_CAP:
+            self._pending = bytearray()
+        else:
+            self._pending.clear()
+
     def flush_jsonl(self) -> str:
-        with open(self._path, "w", encoding="utf-8") as handle:
-            for event in self.events:
-                payload = {"t": event.t, "type": event.type, **event.data}
-                handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
-        summary_payload = self._build_summary()
-        with open(self._summary_path, "w", encoding="utf-8") as handle:
-            json.dump(summary_payload, handle, ensure_ascii=False, indent=2)
-        LOGGER.info("[headers] Search log saved: %s", self._path)
-        LOGGER.info("[headers] Search summary saved: %s", self._summary_path)
+        if self.flush_every > 0:
+            self._write_pending()
+        else:
+            # Serialised straight from the columns so a flush does not leave a
+            # second, row-shaped copy of every event behind.
+            lines = [
+                _dumps({"t": t, "type": event_type, **data})
+                for t, event_type, data in zip(self._t, self._type, self._data)
+            ]
+            lines.append(b"")
+            _write_atomic(self._path, b"\n".join(lines))
+        self.flush_summary()
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("[headers] Search log saved: %s", self._path)
+            LOGGER.info("[headers] Search summary saved: %s", self._summary_path)
         return self._path
 
+    def flush_summary(self) -> str:
+        """Write the aggregated summary JSON and return its path."""
+        _write_atomic(self._summary_path, _dumps_pretty(self._build_summary()))
+        return self._summary_path
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        """Row view of the recorded events, rebuilt on each access."""
+        return [
+            TraceEvent(t, event_type, data)
+            for t, event_type, data in zip(self._t, self._type, self._data)
+        ]
+
     @property
     def path(self) -> str:
         return self._path
@@ -68,206 +221,170 @@ class HeaderTracer:
         return self._summary_path
 
     def as_list(self) -> List[Dict[str, Any]]:
-        return [{"t": event.t, "type": event.type, **event.data} for event in self.events]
+        """Return the events as fresh ``{"t", "type", **data}`` rows."""
+        return [
+            {"t": t, "type": event_type, **data}
+            for t, event_type, data in zip(self._t, self._type, self._data)
+        ]
 
     def _build_summary(self) -> Dict[str, Any]:
-        events = self.as_list()
-        metadata: Dict[str, Any] = {}
-        llm_headers: List[Dict[str, Any]] = []
-        llm_requests: List[Dict[str, Any]] = []
-        llm_raw_responses: List[str] = []
-        llm_fenced_blocks: List[str] = []
-        final_outline: Dict[str, Any] = {}
-        decisions: List[Dict[str, Any]] = []
-        elapsed: float | None = None
-        function_calls: List[Dict[str, Any]] = []
-
-        # --- Chunking aggregation buckets ------------------------------------
-        # We expose a compact chunking summary for the Header Search report.
-        chunking_passes = 0
-        chunking_completes = 0
-        chunk_bounds_resolved = 0
-        chunk_skipped_inverted = 0
-        header_missing_global = 0
-        header_not_in_lines = 0
-        line_index_indexed_total = 0
-        line_index_missing_total = 0
-        last_line_index_map: Dict[str, Any] = {}
-        built_chunks: List[Dict[str, Any]] = []
-        # ----------------------------------------------------------------------
-
-        # Events that the UI should consider "decisions" (show in the list)
-        decision_types = {
-            # existing
-            "candidate_found",
-            "anchor_resolved",
-            "fallback_triggered",
-            "monotonic_violation",
-            # new chunking-related visibility
-            "chunking_start",
-            "line_index_map_built",
-            "header_missing_global",
-            "header_not_in_lines",
-            "chunk_bounds_resolved",
-            "chunk_skipped_inverted",
-            "chunk_built",
-            "chunking_complete",
-            # cache/info that influences behavior
-            "cache_purged",
-            "cache_bypassed",
-        }
+        state = _SummaryState()
+
+        for t, event_type, data in zip(self._t, self._type, self._data):
+            handler = _SUMMARY_HANDLERS.get(event_type)
+            if handler is not None:
+                handler(state, data)
 
-        for event in events:
-            event_type = event.get("type")
-
-            # --- Run metadata / timings
-            if event_type == "start_run":
-                metadata = {
-                    key: value
-                    for key, value in event.items()
-                    if key not in {"t", "type"}
-                }
-
-            elif event_type == "final_outline":
-                final_outline = {
-                    "headers": list(event.get("headers", [])),
-                    "sections": list(event.get("sections", [])),
-                    "mode": event.get("mode"),
-                    "messages": list(event.get("messages", [])),
-                }
-                if "elapsed_s" in event and elapsed is None:
-                    elapsed = event.get("elapsed_s")
-
-            elif event_type == "end_run":
-                if elapsed is None:
-                    elapsed = event.get("elapsed_s")
-                final_outline.setdefault("mode", event.get("mode"))
-
-            # --- LLM plumbing
-            elif event_type == "llm_outline_received":
-                llm_headers = list(event.get("headers", []))
-
-            elif event_type == "llm_request":
-                llm_requests.append(
-                    {
-                        "part": event.get("part"),
-                        "total_parts": event.get("total_parts"),
-                        "model": event.get("model"),
-                        "temperature": event.get("temperature"),
-                        "timeout_read": event.get("timeout_read"),
-                        "params": event.get("params"),
-                        "messages": event.get("messages", []),
-                    }
-                )
-
-            elif event_type == "llm_raw_response":
-                raw_parts = event.get("parts")
-                if isinstance(raw_parts, list):
-                    llm_raw_responses.extend(
-                        str(part) for part in raw_parts if isinstance(part, str)
-                    )
-                elif isinstance(raw_parts, str):
-                    llm_raw_responses.append(raw_parts)
-
-                fenced_parts = event.get("fenced")
-                if isinstance(fenced_parts, list):
-                    llm_fenced_blocks.extend(
-                        str(entry) for entry in fenced_parts if isinstance(entry, str)
-                    )
-                elif isinstance(fenced_parts, str):
-                    llm_fenced_blocks.append(fenced_parts)
-
-            # --- Call stack
-            elif event_type == "function_call":
-                call_entry: Dict[str, Any] = {
-                    "order": len(function_calls) + 1,
-                    "name": str(event.get("name", "")),
-                }
-                context = {
-                    key: value
-                    for key, value in event.items()
-                    if key not in {"t", "type", "name"}
-                }
-                if context:
-                    call_entry["context"] = context
-                function_calls.append(call_entry)
-
-            # --- Chunking visibility (aggregate while we loop)
-            if event_type == "chunking_start":
-                chunking_passes += 1
-
-            elif event_type == "line_index_map_built":
-                # Keep last values; also accumulate to totals in case of multi-pass
-                last_line_index_map = {
-                    "indexed_count": event.get("indexed_count"),
-                    "missing_global_idx": event.get("missing_global_idx"),
-                }
-                line_index_indexed_total += int(event.get("indexed_count") or 0)
-                line_index_missing_total += int(event.get("missing_global_idx") or 0)
-
-            elif event_type == "header_missing_global":
-                header_missing_global += 1
-
-            elif event_type == "header_not_in_lines":
-                header_not_in_lines += 1
-
-            elif event_type == "chunk_bounds_resolved":
-                chunk_bounds_resolved += 1
-
-            elif event_type == "chunk_skipped_inverted":
-                chunk_skipped_inverted += 1
-
-            elif event_type == "chunk_built":
-                built_chunks.append(
-                    {
-                        "position": event.get("position"),
-                        "header_text": event.get("header_text"),
-                        "header_number": event.get("header_number"),
-                        "level": event.get("level"),
-                        "start_global_idx": event.get("start_global_idx"),
-                        "end_global_idx": event.get("end_global_idx"),
-                        "start_page": event.get("start_page"),
-                        "end_page": event.get("end_page"),
-                        "line_count": event.get("line_count"),
-                    }
-                )
-
-            elif event_type == "chunking_complete":
-                chunking_completes += 1
-
-            # --- Decision list collection
-            if event_type in decision_types:
-                decisions.append(event)
+            # --- Decision list collection; only these events need a row.
+            if event_type in _DECISION_TYPES:
+                state.decisions.append({"t": t, "type": event_type, **data})
 
+        # Pure occurrence counts come straight from the type column.
+        type_counts = Counter(self._type)
         chunking_summary = {
-            "passes": chunking_passes,
-            "completes": chunking_completes,
-            "bounds_resolved": chunk_bounds_resolved,
-            "skipped_inverted": chunk_skipped_inverted,
-            "headers_missing_global": header_missing_global,
-            "headers_not_in_lines": header_not_in_lines,
-            "line_index_map": last_line_index_map,
+            "passes": type_counts["chunking_start"],
+            "completes": type_counts["chunking_complete"],
+            "bounds_resolved": type_counts["chunk_bounds_resolved"],
+            "skipped_inverted": type_counts["chunk_skipped_inverted"],
+            "headers_missing_global": type_counts["header_missing_global"],
+            "headers_not_in_lines": type_counts["header_not_in_lines"],
+            "line_index_map": state.last_line_index_map,
             "line_index_map_totals": {
-                "indexed_count": line_index_indexed_total,
-                "missing_global_idx": line_index_missing_total,
+                "indexed_count": state.line_index_indexed_total,
+                "missing_global_idx": state.line_index_missing_total,
             },
-            "chunks": built_chunks,  # ordered by emission (construction order)
+            # ordered by emission (construction order)
+            "chunks": [chunk._asdict() for chunk in state.built_chunks],
         }
 
         return {
             "trace_schema": "v2-chunking",
             "run_id": self.run_id,
-            "metadata": metadata,
-            "llm_headers": llm_headers,
-            "llm_requests": llm_requests,
-            "llm_raw_responses": llm_raw_responses,
-            "llm_fenced_blocks": llm_fenced_blocks,
-            "decisions": decisions,
+            "metadata": state.metadata,
+            "llm_headers": state.llm_headers,
+            "llm_requests": state.llm_requests,
+            "llm_raw_responses": state.llm_raw_responses,
+            "llm_fenced_blocks": state.llm_fenced_blocks,
+            "decisions": state.decisions,
             "chunking": chunking_summary,
-            "final_outline": final_outline,
-            "elapsed_s": elapsed,
-            "function_calls": function_calls,
+            "final_outline": state.final_outline,
+            "elapsed_s": state.elapsed,
+            "function_calls": state.function_calls,
         }
 
 
-__all__ = ["HeaderTracer", "TraceEvent"]
+@dataclass(slots=True)
+class _SummaryState:
+    """Accumulators filled in by the ``_build_summary`` event handlers."""
+
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    llm_headers: List[Dict[str, Any]] = field(default_factory=list)
+    llm_requests: List[Dict[str, Any]] = field(default_factory=list)
+    llm_raw_responses: List[str] = field(default_factory=list)
+    llm_fenced_blocks: List[str] = field(default_factory=list)
+    final_outline: Dict[str, Any] = field(default_factory=dict)
+    decisions: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float | None = None
+    function_calls: List[Dict[str, Any]] = field(default_factory=list)
+
+    # --- Chunking aggregation buckets ----------------------------------------
+    # We expose a compact chunking summary for the Header Search report.
+    line_index_indexed_total: int = 0
+    line_index_missing_total: int = 0
+    last_line_index_map: Dict[str, Any] = field(default_factory=dict)
+    built_chunks: List[BuiltChunk] = field(default_factory=list)
+
+
+# --- Run metadata / timings ---------------------------------------------------
+def _on_start_run(state: _SummaryState, data: Dict[str, Any]) -> None:
+    state.metadata = dict(data)
+
+
+def _on_final_outline(state: _SummaryState, data: Dict[str, Any]) -> None:
+    state.final_outline = {
+        "headers": list(data.get("headers", [])),
+        "sections": list(data.get("sections", [])),
+        "mode": data.get("mode"),
+        "messages": list(data.get("messages", [])),
+    }
+    if "elapsed_s" in data and state.elapsed is None:
+        state.elapsed = data.get("elapsed_s")
+
+
+def _on_end_run(state: _SummaryState, data: Dict[str, Any]) -> None:
+    if state.elapsed is None:
+        state.elapsed = data.get("elapsed_s")
+    state.final_outline.setdefault("mode", data.get("mode"))
+
+
+# --- LLM plumbing -------------------------------------------------------------
+def _on_llm_outline_received(state: _SummaryState, data: Dict[str, Any]) -> None:
+    state.llm_headers = list(data.get("headers", []))
+
+
+def _on_llm_request(state: _SummaryState, data: Dict[str, Any]) -> None:
+    request = dict(zip(_LLM_REQUEST_KEYS, map(data.get, _LLM_REQUEST_KEYS)))
+    request["messages"] = data.get("messages", [])
+    state.llm_requests.append(request)
+
+
+def _on_llm_raw_response(state: _SummaryState, data: Dict[str, Any]) -> None:
+    raw_parts = data.get("parts")
+    if isinstance(raw_parts, list):
+        state.llm_raw_responses.extend(
+            str(part) for part in raw_parts if isinstance(part, str)
+        )
+    elif isinstance(raw_parts, str):
+        state.llm_raw_responses.append(raw_parts)
+
+    fenced_parts = data.get("fenced")
+    if isinstance(fenced_parts, list):
+        state.llm_fenced_blocks.extend(
+            str(entry) for entry in fenced_parts if isinstance(entry, str)
+        )
+    elif isinstance(fenced_parts, str):
+        state.llm_fenced_blocks.append(fenced_parts)
+
+
+# --- Call stack ---------------------------------------------------------------
+def _on_function_call(state: _SummaryState, data: Dict[str, Any]) -> None:
+    call_entry: Dict[str, Any] = {
+        "order": len(state.function_calls) + 1,
+        "name": str(data.get("name", "")),
+    }
+    # Copy rather than pop: the stored event must stay intact for flush_jsonl.
+    context = dict(data)
+    context.pop("name", None)
+    if context:
+        call_entry["context"] = context
+    state.function_calls.append(call_entry)
+
+
+# --- Chunking visibility ------------------------------------------------------
+def _on_line_index_map_built(state: _SummaryState, data: Dict[str, Any]) -> None:
+    # Keep last values; also accumulate to totals in case of multi-pass
+    state.last_line_index_map = {
+        "indexed_count": data.get("indexed_count"),
+        "missing_global_idx": data.get("missing_global_idx"),
+    }
+    state.line_index_indexed_total += int(data.get("indexed_count") or 0)
+    state.line_index_missing_total += int(data.get("missing_global_idx") or 0)
+
+
+def _on_chunk_built(state: _SummaryState, data: Dict[str, Any]) -> None:
+    state.built_chunks.append(BuiltChunk._make(map(data.get, BuiltChunk._fields)))
+
+
+_SUMMARY_HANDLERS: Dict[str, Callable[[_SummaryState, Dict[str, Any]], None]] = {
+    "start_run": _on_start_run,
+    "final_outline": _on_final_outline,
+    "end_run": _on_end_run,
+    "llm_outline_received": _on_llm_outline_received,
+    "llm_request": _on_llm_request,
+    "llm_raw_response": _on_llm_raw_response,
+    "function_call": _on_function_call,
+    "line_index_map_built": _on_line_index_map_built,
+    "chunk_built": _on_chunk_built,
+}
+
+__all__ = ["BuiltChunk", "HeaderTracer", "TraceEvent"]
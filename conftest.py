@@ -0,0 +1,57 @@
+"""Shared pytest hooks for the ``tests`` and ``backend/tests`` suites."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Iterator
+
+import pytest
+
+from backend.services.simpleheaders_state import SimpleHeadersState
+
+_EVENT_LOOP_KEY = pytest.StashKey[asyncio.AbstractEventLoop]()
+
+
+def _session_loop(session: pytest.Session) -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by every coroutine test in the session."""
+
+    loop = session.stash.get(_EVENT_LOOP_KEY, None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        session.stash[_EVENT_LOOP_KEY] = loop
+    return loop
+
+
+@pytest.fixture(autouse=True)
+def _reset_simpleheaders_state() -> Iterator[None]:
+    """Run every test in both suites against an empty SimpleHeadersState cache."""
+
+    SimpleHeadersState.reset()
+    yield
+    SimpleHeadersState.reset()
+
+
+def pytest_pyfunc_call(pyfuncitem):
+    if asyncio.iscoroutinefunction(pyfuncitem.obj):
+        loop = _session_loop(pyfuncitem.session)
+        signature = inspect.signature(pyfuncitem.obj)
+        kwargs = {
+            name: pyfuncitem.funcargs[name]
+            for name in signature.parameters
+            if name in pyfuncitem.funcargs
+        }
+        try:
+            loop.run_until_complete(pyfuncitem.obj(**kwargs))
+        finally:
+            # Let callbacks scheduled by the test run before the next one starts.
+            loop.run_until_complete(asyncio.sleep(0))
+        return True
+    return None
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    loop = session.stash.get(_EVENT_LOOP_KEY, None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
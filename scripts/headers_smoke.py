@@ -11,11 +11,10 @@ from backend.services.pdf_native import parse_pdf
 
 
 def _page_texts(parse_result) -> list[str]:
-    pages: list[str] = []
-    for page in parse_result.pages:
-        text = "\n".join(block.text for block in page.blocks if block.text.strip())
-        pages.append(text)
-    return pages
+    return [
+        "\n".join(text for block in page.blocks if (text := block.text).strip())
+        for page in parse_result.pages
+    ]
 
 
 async def _run(path: Path) -> None:
@@ -26,13 +25,10 @@ async def _run(path: Path) -> None:
     result = await extract_headers(pages, config=config)
     print("Attempts:")
     for attempt in result.attempts:
-        payload = {
-            "rung": attempt.rung,
-            "status": attempt.status,
-            "reason": attempt.reason,
-            "retries": attempt.retries,
-        }
-        print(f"  - {payload}")
+        print(
+            f"  - {{'rung': {attempt.rung!r}, 'status': {attempt.status!r}, "
+            f"'reason': {attempt.reason!r}, 'retries': {attempt.retries!r}}}"
+        )
     print("\nHeaders:")
     for item in result.headers:
         number = item.number or ""
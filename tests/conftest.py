@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
-import inspect
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Generator
 
@@ -16,7 +15,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.config import reset_settings_cache  # noqa: E402
-from backend.database import reset_database_state  # noqa: E402
+from backend.database import init_db, reset_database_state  # noqa: E402
 from backend.observability import metrics_registry  # noqa: E402
 
 
@@ -43,29 +42,31 @@ def _isolate_environment(
     metrics_registry.reset()
 
 
-@pytest.fixture()
-def client() -> Generator[TestClient, None, None]:
-    """Return a test client for the FastAPI application."""
+@pytest.fixture(scope="session")
+def _app_client(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[TestClient, None, None]:
+    """Start the FastAPI application once for the whole test session."""
 
     from backend.main import app
 
-    with TestClient(app) as test_client:
+    startup_db = tmp_path_factory.mktemp("app") / "startup.db"
+    with ExitStack() as stack:
+        # Keep the lifespan's init_db() away from the default project database.
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setenv("DATABASE_URL", f"sqlite:///{startup_db}")
+            reset_settings_cache()
+            reset_database_state()
+            test_client = stack.enter_context(TestClient(app))
+        reset_settings_cache()
+        reset_database_state()
         yield test_client
 
 
+@pytest.fixture()
+def client(_app_client: TestClient) -> TestClient:
+    """Return the shared test client with this test's database initialised."""
+
+    init_db()
+    return _app_client
 
-def pytest_pyfunc_call(pyfuncitem):
-    if asyncio.iscoroutinefunction(pyfuncitem.obj):
-        loop = asyncio.new_event_loop()
-        try:
-            signature = inspect.signature(pyfuncitem.obj)
-            kwargs = {
-                name: pyfuncitem.funcargs[name]
-                for name in signature.parameters
-                if name in pyfuncitem.funcargs
-            }
-            loop.run_until_complete(pyfuncitem.obj(**kwargs))
-        finally:
-            loop.close()
-        return True
-    return None
@@ -6,7 +6,6 @@ from backend.headers.extract_headers import HeadersConfig, extract_headers
 from backend.headers.llm_client import LLMResponse
 from backend.headers.models import HeaderItem
 from backend.services.openrouter_client import OpenRouterError
-import asyncio
 from pathlib import Path
 
 
@@ -24,7 +23,7 @@ class CyclingStubLLM:
         return LLMResponse(text=response, model="stub")
 
 
-def test_retry_ladder_hits_fallback_model() -> None:
+async def test_retry_ladder_hits_fallback_model() -> None:
     payload = "```SIMPLEHEADERS\n[{\"title\": \"Scope\", \"number\": \"1\", \"level\": 1, \"page\": 1}]\n```"
     primary = CyclingStubLLM(
         [
@@ -50,14 +49,12 @@ def test_retry_ladder_hits_fallback_model() -> None:
         strict_invariants=True,
         title_only_reanchor=True,
     )
-    result = asyncio.run(
-        extract_headers(
-            ["Section 1 Scope"],
-            config=config,
-            llm_client=primary,
-            fallback_client=fallback,
-            legacy_locator=lambda pages: [],
-        )
+    result = await extract_headers(
+        ["Section 1 Scope"],
+        config=config,
+        llm_client=primary,
+        fallback_client=fallback,
+        legacy_locator=lambda pages: [],
     )
     assert result.ok
     reasons = [attempt.reason for attempt in result.attempts if attempt.reason]
@@ -65,7 +62,7 @@ def test_retry_ladder_hits_fallback_model() -> None:
     assert result.headers[0].title == "Scope"
 
 
-def test_legacy_locator_used_after_all_failures() -> None:
+async def test_legacy_locator_used_after_all_failures() -> None:
     primary = CyclingStubLLM(["not a fence", "```WRONG\n[]\n```"])
     legacy_headers = [HeaderItem(number="1", title="Legacy Scope", level=1, page=1, order=0)]
     config = HeadersConfig(
@@ -84,14 +81,12 @@ def test_legacy_locator_used_after_all_failures() -> None:
         strict_invariants=True,
         title_only_reanchor=True,
     )
-    result = asyncio.run(
-        extract_headers(
-            ["Section 1"],
-            config=config,
-            llm_client=primary,
-            fallback_client=None,
-            legacy_locator=lambda pages: legacy_headers,
-        )
+    result = await extract_headers(
+        ["Section 1"],
+        config=config,
+        llm_client=primary,
+        fallback_client=None,
+        legacy_locator=lambda pages: legacy_headers,
     )
     assert result.ok
     assert result.attempts[-1].rung == "fallback_legacy"
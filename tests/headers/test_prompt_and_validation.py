@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 import pytest
 
+from backend.headers import validators
 from backend.headers.extract_headers import HeadersConfig, extract_headers
 from backend.headers.llm_client import LLMResponse
 from backend.headers.validators import (
     detect_bad_label,
     extract_fenced_simpleheaders_block,
     parse_fenced_payload,
+    parse_simpleheaders_block,
 )
 
 
@@ -58,7 +59,27 @@ def test_parse_fenced_payload_invalid_schema(payload: str) -> None:
         parse_fenced_payload(payload)
 
 
-def test_abort_response_advances_to_next_rung() -> None:
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_simpleheaders_block_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(validators, "orjson", None)
+    elif validators.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    headers = parse_simpleheaders_block(
+        '[{"title": "Überblick", "number": "1", "level": 1, "page": 2}]'
+    )
+    assert [(item.number, item.title, item.page) for item in headers] == [
+        ("1", "Überblick", 2)
+    ]
+
+    with pytest.raises(ValueError, match="invalid_json"):
+        parse_simpleheaders_block("not json")
+
+
+async def test_abort_response_advances_to_next_rung() -> None:
     payload = "```SIMPLEHEADERS\n[{\"title\": \"Scope\", \"number\": \"1\", \"level\": 1, \"page\": 1}]\n```"
     client = StubLLMClient(["ABORT", payload])
     config = HeadersConfig(
@@ -79,13 +100,11 @@ def test_abort_response_advances_to_next_rung() -> None:
     )
     legacy_headers: list = []
 
-    result = asyncio.run(
-        extract_headers(
-            ["Page 1 title"],
-            config=config,
-            llm_client=client,
-            legacy_locator=lambda pages: legacy_headers,
-        )
+    result = await extract_headers(
+        ["Page 1 title"],
+        config=config,
+        llm_client=client,
+        legacy_locator=lambda pages: legacy_headers,
     )
 
     assert result.ok
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import pytest
 
 from backend.headers.extract_headers import HeadersConfig, extract_headers
@@ -23,7 +22,7 @@ class ScriptedLLM:
         return LLMResponse(text=response, model="stub")
 
 
-def test_attempt_summaries_capture_failure_reasons() -> None:
+async def test_attempt_summaries_capture_failure_reasons() -> None:
     config = HeadersConfig(
         model="primary",
         fallback_model="backup",
@@ -50,27 +49,23 @@ def test_attempt_summaries_capture_failure_reasons() -> None:
     )
     fallback = ScriptedLLM(["ABORT"])
 
-    result = asyncio.run(
-        extract_headers(
-            ["Page"],
-            config=config,
-            llm_client=primary,
-            fallback_client=fallback,
-            legacy_locator=lambda pages: [],
-        )
+    result = await extract_headers(
+        ["Page"],
+        config=config,
+        llm_client=primary,
+        fallback_client=fallback,
+        legacy_locator=lambda pages: [],
     )
     reasons_run_one = [attempt.reason for attempt in result.attempts if attempt.reason]
 
-    result_two = asyncio.run(
-        extract_headers(
-            ["Page"],
-            config=config,
-            llm_client=ScriptedLLM(
-                ["text without fence", "```WRONG\n[]\n```", "```SIMPLEHEADERS\nnot json\n```"]
-            ),
-            fallback_client=None,
-            legacy_locator=lambda pages: [],
-        )
+    result_two = await extract_headers(
+        ["Page"],
+        config=config,
+        llm_client=ScriptedLLM(
+            ["text without fence", "```WRONG\n[]\n```", "```SIMPLEHEADERS\nnot json\n```"]
+        ),
+        fallback_client=None,
+        legacy_locator=lambda pages: [],
     )
     reasons_run_two = [attempt.reason for attempt in result_two.attempts if attempt.reason]
 